@@ -3,20 +3,11 @@ import streamlit as st
 import requests
 import json
 import os
-from langdetect import detect
-import google.generativeai as genai
-import pandas as pd
 from datetime import datetime
+from faq_store import load_faq
 
-# Load FAQ data
-try:
-    faq = pd.read_csv('faq_questions_answers.csv')
-    # Ensure full column width and all rows are shown
-    pd.set_option('display.max_colwidth', None)   # Show full text in each cell
-    pd.set_option('display.max_rows', None)       # Show all rows
-except FileNotFoundError:
-    # Create empty DataFrame if CSV doesn't exist
-    faq = pd.DataFrame(columns=['question', 'answer'])
+# Load FAQ data (compiled faq.bin when present, CSV otherwise; empty if neither exists)
+faq = load_faq()
 
 # Load environment variables
 load_dotenv()
@@ -43,16 +34,27 @@ def configure_gemini():
         if not api_key:
             st.error("GEMINI_API_KEY not set in environment.")
             return False
-        genai.configure(api_key=api_key)
         st.session_state.api_configured = True
         return True
     except Exception as e:
         st.error(f"Gemini configuration failed: {str(e)}")
         return False
 
+# Gemini SDK is heavy: import and configure it on first use, not at startup
+_genai = None
+
+def get_genai():
+    global _genai
+    if _genai is None:
+        import google.generativeai as genai
+        genai.configure(api_key=os.getenv("GEMINI_API_KEY", ""))
+        _genai = genai
+    return _genai
+
 # Language detection
 def detect_language(text):
     try:
+        from langdetect import detect
         lang = detect(text)
         return "French" if lang == "fr" else "English"
     except:
@@ -79,7 +81,7 @@ def is_question_related_to_context(current_query, conversation_history):
         return False
     
     try:
-        model = genai.GenerativeModel("gemini-1.5-flash")
+        model = get_genai().GenerativeModel("gemini-1.5-flash")
         
         # Get last few messages for context
         recent_history = conversation_history[-6:]  # Last 3 exchanges
@@ -115,7 +117,7 @@ def is_question_related_to_context(current_query, conversation_history):
 def reformulate_query_with_context(current_query, conversation_history, language):
     """Reformulate the current query by incorporating relevant conversation context"""
     try:
-        model = genai.GenerativeModel("gemini-1.5-flash")
+        model = get_genai().GenerativeModel("gemini-1.5-flash")
         
         # Get relevant conversation history
         recent_history = conversation_history[-6:]  # Last 3 exchanges
@@ -160,7 +162,7 @@ def reformulate_query_with_context(current_query, conversation_history, language
 # Classify query using Gemini
 def classify_query(query):
     try:
-        model = genai.GenerativeModel("gemini-2.5-flash-preview-05-20")
+        model = get_genai().GenerativeModel("gemini-2.5-flash-preview-05-20")
         prompt = f"""
         You are a classifier assistant. Your task is to:
         1. Understand the user's query: "{query}" (it may be in French).
@@ -178,7 +180,7 @@ def classify_query(query):
         - Lists or rankings of products/brands in specific categories (e.g., "top 10 products in X"), possibly with conditions (e.g., location-based filters)
 
         2. **analyze** → Use this label if the query is about legal documents, explanations, platform-related information, or general help. This includes:
-        - If the query {query}, when translated to French, matches any item in {faq['question'].tolist() if not faq.empty else []}, it should be categorized as analyze.
+        - If the query {query}, when translated to French, matches any item in {faq['question']}, it should be categorized as analyze.
         - Privacy Policy: questions about user data usage, protection, or collection
         - Terms of Service (CGU): user rights and platform conditions
         - Platform help: how things work on Shop My Influence
@@ -278,7 +280,7 @@ def call_api(query, language, conversation_history, influencer_uid="la0NUVFtxnNn
 # Generate response using Gemini
 def generate_natural_response(api_response, user_query, language):
     try:
-        model = genai.GenerativeModel("gemini-1.5-flash")
+        model = get_genai().GenerativeModel("gemini-1.5-flash")
 
         # Handle different response formats
         if "references" in api_response:
@@ -0,0 +1,70 @@
+import csv
+import marshal
+import mmap
+import os
+import sys
+
+FAQ_CSV = "faq_questions_answers.csv"
+FAQ_BIN = "faq.bin"
+
+# Bump the version byte whenever the layout of the compiled payload changes
+MAGIC = b"FAQ\x01"
+
+
+# Read the FAQ CSV into plain column lists (no pandas needed for 40 rows)
+def read_faq_csv(csv_path=FAQ_CSV):
+    faq = {"question": [], "answer": []}
+    try:
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                faq["question"].append(row.get("question") or "")
+                faq["answer"].append(row.get("answer") or "")
+    except FileNotFoundError:
+        pass
+    return faq
+
+
+# Derived index: normalised question -> row number
+def _with_index(faq):
+    faq["index"] = {q.strip().lower(): i for i, q in enumerate(faq["question"])}
+    return faq
+
+
+# Compile the FAQ (and its derived lookup index) into a binary artifact
+def compile_faq(csv_path=FAQ_CSV, bin_path=FAQ_BIN):
+    faq = _with_index(read_faq_csv(csv_path))
+    tmp_path = bin_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        marshal.dump(faq, f)
+    os.replace(tmp_path, bin_path)
+    return faq
+
+
+# Load the compiled artifact with a single memory-mapped read
+def _load_compiled(bin_path):
+    with open(bin_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{bin_path} is not a compiled FAQ artifact")
+            with memoryview(mm) as view:
+                return marshal.loads(view[len(MAGIC):])
+
+
+# Load the FAQ, preferring the artifact built at image build time
+def load_faq(csv_path=FAQ_CSV, bin_path=FAQ_BIN):
+    try:
+        # Ignore an artifact older than the CSV it was compiled from
+        if not os.path.exists(csv_path) or os.path.getmtime(bin_path) >= os.path.getmtime(csv_path):
+            return _load_compiled(bin_path)
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+    return _with_index(read_faq_csv(csv_path))
+
+
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else FAQ_CSV
+    bin_path = sys.argv[2] if len(sys.argv) > 2 else FAQ_BIN
+    faq = compile_faq(csv_path, bin_path)
+    print(f"Compiled {len(faq['question'])} FAQ entries from {csv_path} into {bin_path} "
+          f"({os.path.getsize(bin_path)} bytes)")
@@ -3,17 +3,15 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from dotenv import load_dotenv
 import os
-import pandas as pd
-import google.generativeai as genai
 import requests
 import json
-from langdetect import detect
+from faq_store import load_faq
 
 # Load .env
 load_dotenv()
 
-# Load FAQ
-faq = pd.read_csv('faq_questions_answers.csv')
+# Load FAQ (compiled faq.bin when present, CSV otherwise)
+faq = load_faq()
 
 # FastAPI init
 app = FastAPI()
@@ -25,8 +23,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Configure Gemini API
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+# Gemini SDK is heavy: import and configure it on first use, not at worker spawn
+_genai = None
+
+def get_genai():
+    global _genai
+    if _genai is None:
+        import google.generativeai as genai
+        genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+        _genai = genai
+    return _genai
 
 # Request model
 class ChatRequest(BaseModel):
@@ -36,6 +42,7 @@ class ChatRequest(BaseModel):
 # Detect language
 def detect_language(text):
     try:
+        from langdetect import detect
         return "French" if detect(text) == "fr" else "English"
     except:
         return "English"
@@ -43,7 +50,7 @@ def detect_language(text):
 # Classify query
 def classify_query(query):
     try:
-        model = genai.GenerativeModel("gemini-2.5-flash-preview-05-20")
+        model = get_genai().GenerativeModel("gemini-2.5-flash-preview-05-20")
         prompt = f"""
         You are a classifier assistant. Your task is to:
         1. Understand the user's query: "{query}" (it may be in French).
@@ -89,7 +96,7 @@ def call_api(query, language, uid):
     query_type = classify_query(query)
     if query_type == "web":
         try:
-            model = genai.GenerativeModel("gemini-1.5-flash")
+            model = get_genai().GenerativeModel("gemini-1.5-flash")
             prompt = (
                 f"Tu es un assistant qui répond à des questions d’actualité en français : {query}"
                 if language == "French"
@@ -117,7 +124,7 @@ def call_api(query, language, uid):
 # Generate natural language response
 def generate_natural_response(api_response, user_query, language):
     try:
-        model = genai.GenerativeModel("gemini-1.5-flash")
+        model = get_genai().GenerativeModel("gemini-1.5-flash")
 
         if "references" in api_response:
             api_summary = f"""
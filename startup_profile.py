@@ -0,0 +1,58 @@
+import argparse
+import subprocess
+import sys
+
+# Per-entrypoint import-time budget in milliseconds
+BUDGETS_MS = {"app": 1500, "main": 800}
+
+# SDKs that must only be imported on first use, never at startup
+LAZY_MODULES = ("pandas", "google.generativeai", "langdetect", "langchain")
+
+
+# Import a module in a fresh interpreter under -X importtime and parse the trace
+def profile_import(module):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    # Lines look like: "import time:   self [us] | cumulative | imported package"
+    timings = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        timings.append((name.strip(), int(self_us), int(cumulative_us)))
+    return proc.returncode, proc.stderr, timings
+
+
+# Print a report for one entrypoint and return True if it stays within budget
+def report(module, budget_ms, top):
+    returncode, stderr, timings = profile_import(module)
+    if returncode != 0:
+        print(f"== {module}: import failed ==")
+        print(stderr.strip().splitlines()[-1] if stderr.strip() else "no output")
+        return False
+
+    # The module itself is the last top-level entry in the trace
+    total_ms = next(cum for name, _, cum in reversed(timings) if name == module) / 1000
+    eager = sorted({name for name, _, _ in timings
+                    if any(name == m or name.startswith(m + ".") for m in LAZY_MODULES)})
+    ok = total_ms <= budget_ms and not eager
+
+    print(f"== {module}: {total_ms:.1f} ms (budget {budget_ms} ms) {'OK' if ok else 'FAIL'} ==")
+    for name, self_us, cumulative_us in sorted(timings, key=lambda t: t[2], reverse=True)[:top]:
+        print(f"  {cumulative_us / 1000:9.1f} ms cumulative {self_us / 1000:8.1f} ms self  {name}")
+    if eager:
+        print(f"  eagerly imported (should be lazy): {', '.join(eager)}")
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report import-time startup cost of the chatbot entrypoints.")
+    parser.add_argument("modules", nargs="*", default=list(BUDGETS_MS), help="entrypoints to profile")
+    parser.add_argument("--top", type=int, default=15, help="number of slowest imports to list")
+    args = parser.parse_args()
+
+    results = [report(m, BUDGETS_MS.get(m, min(BUDGETS_MS.values())), args.top) for m in args.modules]
+    sys.exit(0 if all(results) else 1)